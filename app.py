@@ -1,3 +1,4 @@
+import io
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -7,6 +8,43 @@ from prophet import Prophet
 # Streamlit Page Configuration
 st.set_page_config(page_title="Stock Price Prediction", layout="wide")
 
+
+@st.cache_data
+def load_data(csv_bytes: bytes) -> pd.DataFrame:
+    """Parses the uploaded CSV bytes into a Prophet-ready DataFrame with 'ds' and 'y' columns."""
+    required_cols = {'Date', 'Close'}
+    df = pd.read_csv(io.BytesIO(csv_bytes), usecols=lambda col: col in required_cols,
+                     dtype={'Close': 'float32'}, engine='c')
+
+    # Ensure necessary columns
+    missing_cols = required_cols - set(df.columns)
+    if missing_cols:
+        raise ValueError(f"Missing columns: {missing_cols}. Ensure CSV contains 'Date' and 'Close'.")
+
+    # Preprocess Data
+    df = df.rename(columns={'Date': 'ds', 'Close': 'y'})
+    df['ds'] = pd.to_datetime(df['ds'], format='ISO8601', errors='coerce', cache=True)
+    df['ds'] = df['ds'].dt.tz_localize(None)  # Remove timezone if present
+    df.dropna(inplace=True)
+    return df
+
+
+@st.cache_resource(show_spinner="Fitting Prophet...")
+def fit_prophet(csv_bytes: bytes) -> Prophet:
+    """Fits a Prophet model on the uploaded data; cached so reruns on the same file skip the fit."""
+    model = Prophet(uncertainty_samples=200)  # Enough samples for the plotted confidence band
+    model.fit(load_data(csv_bytes))
+    return model
+
+
+@st.cache_data
+def make_forecast(csv_bytes: bytes, future_days: int) -> pd.DataFrame:
+    """Forecasts future_days ahead with the cached model for the uploaded data."""
+    model = fit_prophet(csv_bytes)
+    future = model.make_future_dataframe(periods=future_days)
+    return model.predict(future)
+
+
 # Title of the App
 st.title("📈 Stock Price Prediction using Prophet")
 
@@ -18,32 +56,18 @@ future_days = st.slider("Select Number of Days to Predict", min_value=30, max_va
 
 if uploaded_file:
     # Load Data
-    df = pd.read_csv(uploaded_file)
-
-    # Ensure necessary columns
-    required_cols = {'Date', 'Close'}
-    missing_cols = required_cols - set(df.columns)
-    if missing_cols:
-        st.error(f"Missing columns: {missing_cols}. Ensure CSV contains 'Date' and 'Close'.")
+    csv_bytes = uploaded_file.getvalue()
+    try:
+        df = load_data(csv_bytes)
+    except ValueError as e:
+        st.error(str(e))
     else:
-        # Preprocess Data
-        df = df[['Date', 'Close']]
-        df.rename(columns={'Date': 'ds', 'Close': 'y'}, inplace=True)
-        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
-        df['ds'] = df['ds'].dt.tz_localize(None)  # Remove timezone if present
-        df.dropna(inplace=True)
-
         # Display Raw Data
         st.subheader("📊 Raw Data Preview")
         st.dataframe(df.head())
 
-        # Train Prophet Model
-        model = Prophet()
-        model.fit(df)
-
-        # Predict Future Prices
-        future = model.make_future_dataframe(periods=future_days)
-        forecast = model.predict(future)
+        # Train Prophet Model and Predict Future Prices
+        forecast = make_forecast(csv_bytes, future_days)
 
         # Plot Forecast
         st.subheader("📉 Stock Price Forecast")
@@ -0,0 +1,27 @@
+"""
+Builds the optional Cython indicator kernels (src/_indicators.pyx) in place:
+
+    python setup.py build_ext --inplace
+
+technical_indicators.py uses the compiled module when present and falls back to the
+Numba kernels otherwise.
+"""
+import sys
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+# No fast-math: the kernels rely on IEEE NaN checks to handle missing prices
+if sys.platform == "win32":
+    compile_args = ["/O2"]
+else:
+    compile_args = ["-O3", "-march=native"]
+
+extensions = [
+    Extension("_indicators", ["src/_indicators.pyx"], extra_compile_args=compile_args),
+]
+
+setup(
+    name="time-series-analysis-indicators",
+    package_dir={"": "src"},
+    ext_modules=cythonize(extensions, compiler_directives={"language_level": 3}),
+)
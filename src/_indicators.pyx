@@ -0,0 +1,322 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the indicator kernels in _indicators_numba.
+
+Same functions, signatures and results, but compiled ahead of time with no Numba/LLVM
+dependency or JIT warmup. Build it in place with `python setup.py build_ext --inplace`.
+"""
+import numpy as np
+from libc.math cimport NAN, isnan, sqrt
+
+
+cdef inline double _ewm_step(double acc, double* old_wt, double x, double alpha) noexcept nogil:
+    """
+    Advances pandas' ewm(alpha=alpha, adjust=False).mean() recurrence by one input.
+
+    As with pandas' default ignore_na=False, a missing x keeps acc but decays its weight, and acc
+    stays NaN until the first non-missing input. Start from acc = NaN, old_wt = 1.
+    """
+    if isnan(acc):
+        old_wt[0] = 1.0
+        return x
+    old_wt[0] *= 1.0 - alpha
+    if not isnan(x):
+        acc = (old_wt[0] * acc + alpha * x) / (old_wt[0] + alpha)
+        old_wt[0] = 1.0
+    return acc
+
+
+def ema(const float[::1] x, double alpha):
+    """
+    Computes the exponential moving average y[i] = alpha * x[i] + (1 - alpha) * y[i - 1].
+
+    Equivalent to pandas' ewm(alpha=alpha, adjust=False).mean(), including its handling of
+    missing values.
+
+    :param x: Input array.
+    :param alpha: Smoothing factor, 2 / (span + 1) for a span-based EMA.
+    :return: Array of EMA values.
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    y_arr = np.empty(n, dtype=np.float32)
+    cdef float[::1] y = y_arr
+    cdef Py_ssize_t i
+    cdef double acc = NAN, old_wt = 1.0
+    with nogil:
+        for i in range(n):
+            acc = _ewm_step(acc, &old_wt, x[i], alpha)
+            y[i] = <float>acc
+    return y_arr
+
+
+def macd(const float[::1] x, double alpha_short, double alpha_long, double alpha_signal):
+    """
+    Computes the MACD line (short EMA - long EMA) and its signal line EMA.
+
+    The EMAs are subtracted and smoothed in double and only rounded to float on output,
+    exactly as in compute_all.
+
+    :param x: Input array.
+    :param alpha_short: Smoothing factor of the short EMA.
+    :param alpha_long: Smoothing factor of the long EMA.
+    :param alpha_signal: Smoothing factor of the signal line.
+    :return: Tuple of arrays (macd, signal).
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    macd_arr = np.empty(n, dtype=np.float32)
+    signal_arr = np.empty(n, dtype=np.float32)
+    cdef float[::1] macd_line = macd_arr
+    cdef float[::1] signal = signal_arr
+    cdef Py_ssize_t i
+    cdef double short_ema = NAN, long_ema = NAN, signal_val = NAN
+    cdef double short_wt = 1.0, long_wt = 1.0, signal_wt = 1.0
+    cdef double v, macd_val
+    with nogil:
+        for i in range(n):
+            v = x[i]
+            short_ema = _ewm_step(short_ema, &short_wt, v, alpha_short)
+            long_ema = _ewm_step(long_ema, &long_wt, v, alpha_long)
+            macd_val = short_ema - long_ema
+            signal_val = _ewm_step(signal_val, &signal_wt, macd_val, alpha_signal)
+            macd_line[i] = <float>macd_val
+            signal[i] = <float>signal_val
+    return macd_arr, signal_arr
+
+
+def rolling_minmax(const float[::1] x, Py_ssize_t w, bint find_max):
+    """
+    Computes the rolling minimum (or maximum) of x in O(N) with a monotonic deque.
+
+    :param x: Input array.
+    :param w: Window length.
+    :param find_max: Compute the rolling maximum instead of the minimum.
+    :return: Array of rolling extrema, NaN for the first w - 1 entries and for every window
+             containing a missing value, as with pandas' rolling(w).
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    out_arr = np.empty(n, dtype=np.float32)
+    cdef float[::1] out = out_arr
+    cdef Py_ssize_t[::1] dq = np.empty(n, dtype=np.intp)
+    # Missing values are counted instead of pushed, as NaN comparisons would corrupt the deque
+    cdef Py_ssize_t i, head = 0, tail = 0, n_nan = 0
+    with nogil:
+        for i in range(n):
+            if isnan(x[i]):
+                n_nan += 1
+            else:
+                if find_max:
+                    while tail > head and x[dq[tail - 1]] <= x[i]:
+                        tail -= 1
+                else:
+                    while tail > head and x[dq[tail - 1]] >= x[i]:
+                        tail -= 1
+                dq[tail] = i
+                tail += 1
+            if i >= w and isnan(x[i - w]):
+                n_nan -= 1
+            if tail > head and dq[head] <= i - w:
+                head += 1
+            out[i] = x[dq[head]] if i >= w - 1 and n_nan == 0 else NAN
+    return out_arr
+
+
+def rolling_mean_std(const float[::1] x, Py_ssize_t w):
+    """
+    Computes the rolling mean and sample standard deviation of x in a single pass.
+
+    :param x: Input array.
+    :param w: Window length.
+    :return: Tuple of arrays (mean, std), NaN for the first w - 1 entries and for every window
+             containing a missing value, as with pandas' rolling(w). std is all NaN for w = 1.
+    """
+    cdef Py_ssize_t n = x.shape[0]
+    mean_arr = np.empty(n, dtype=np.float32)
+    std_arr = np.empty(n, dtype=np.float32)
+    cdef float[::1] mean = mean_arr
+    cdef float[::1] std = std_arr
+    cdef Py_ssize_t i, n_nan = 0
+    # Accumulate in double so that s2 - s1^2 / w does not cancel catastrophically. Missing
+    # values are counted instead of summed, so they only affect the windows that contain them.
+    cdef double s1 = 0.0, s2 = 0.0, v, old, var
+    with nogil:
+        for i in range(n):
+            v = x[i]
+            if isnan(v):
+                n_nan += 1
+            else:
+                s1 += v
+                s2 += v * v
+            if i >= w:
+                old = x[i - w]
+                if isnan(old):
+                    n_nan -= 1
+                else:
+                    s1 -= old
+                    s2 -= old * old
+            if i >= w - 1 and n_nan == 0:
+                mean[i] = <float>(s1 / w)
+                # The sample std of a single value is undefined; std is NaN, as in pandas
+                if w > 1:
+                    var = (s2 - s1 * s1 / w) / (w - 1)
+                    std[i] = <float>(sqrt(var) if var > 0 else 0.0)
+                else:
+                    std[i] = NAN
+            else:
+                mean[i] = NAN
+                std[i] = NAN
+    return mean_arr, std_arr
+
+
+# Column layout of compute_all's output block, as in _indicators_numba
+cdef enum:
+    SMA, EMA, RSI, K, D, MACD, SIGNAL, BB_UPPER, BB_LOWER
+
+
+def compute_all(const float[::1] close, const float[::1] high, const float[::1] low,
+                Py_ssize_t sma_w, Py_ssize_t ema_w, Py_ssize_t rsi_w, Py_ssize_t k_w, Py_ssize_t d_w,
+                Py_ssize_t macd_s, Py_ssize_t macd_l, Py_ssize_t macd_sig, Py_ssize_t bb_w, double bb_std,
+                float[:, ::1] out):
+    """
+    Computes every indicator of TechnicalIndicators in a single pass over the price arrays.
+
+    Missing prices are handled like pandas: a rolling window containing one is NaN, and the
+    exponential averages carry their state over it.
+
+    :param out: Preallocated (N, 9) array receiving SMA, EMA, RSI, %K, %D, MACD, MACD Signal,
+                Bollinger Upper and Bollinger Lower.
+    """
+    cdef Py_ssize_t n = close.shape[0]
+    if n == 0:
+        return
+
+    cdef double alpha_ema = 2.0 / (ema_w + 1)
+    cdef double alpha_rsi = 1.0 / rsi_w
+    cdef double alpha_s = 2.0 / (macd_s + 1)
+    cdef double alpha_l = 2.0 / (macd_l + 1)
+    cdef double alpha_sig = 2.0 / (macd_sig + 1)
+
+    # Monotonic deques of candidate indices for the rolling Low minimum / High maximum
+    cdef Py_ssize_t[::1] min_dq = np.empty(n, dtype=np.intp)
+    cdef Py_ssize_t[::1] max_dq = np.empty(n, dtype=np.intp)
+    cdef Py_ssize_t min_head = 0, min_tail = 0, max_head = 0, max_tail = 0
+
+    # Running state is kept in double; only the outputs are float32. The *_nan counters track
+    # missing values inside each rolling window, which are left out of the running sums.
+    cdef double sma_sum = 0.0, bb_sum = 0.0, bb_sq_sum = 0.0, k_sum = 0.0
+    cdef Py_ssize_t sma_nan = 0, bb_nan = 0, low_nan = 0, high_nan = 0, k_count = 0
+    cdef double avg_gain = 0.0, avg_loss = 0.0
+    cdef double ema_val = NAN, short_ema = NAN, long_ema = NAN, signal_val = NAN
+    cdef double ema_wt = 1.0, short_wt = 1.0, long_wt = 1.0, signal_wt = 1.0
+    cdef double x, delta, gain, loss, low_min, high_max, old, mean, var, std, macd_val
+    cdef bint x_nan, k_valid
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(n):
+            x = close[i]
+            x_nan = isnan(x)
+
+            # Simple Moving Average
+            if x_nan:
+                sma_nan += 1
+            else:
+                sma_sum += x
+            if i >= sma_w:
+                old = close[i - sma_w]
+                if isnan(old):
+                    sma_nan -= 1
+                else:
+                    sma_sum -= old
+            out[i, SMA] = <float>(sma_sum / sma_w) if i >= sma_w - 1 and sma_nan == 0 else NAN
+
+            # Exponential Moving Average
+            ema_val = _ewm_step(ema_val, &ema_wt, x, alpha_ema)
+            out[i, EMA] = <float>ema_val
+
+            # Relative Strength Index (Wilder's smoothing); a missing price counts as no change
+            out[i, RSI] = NAN
+            if i > 0:
+                delta = x - close[i - 1]
+                gain = delta if delta > 0 else 0.0
+                loss = -delta if delta < 0 else 0.0
+                avg_gain = alpha_rsi * gain + (1.0 - alpha_rsi) * avg_gain
+                avg_loss = alpha_rsi * loss + (1.0 - alpha_rsi) * avg_loss
+                if avg_loss > 0:
+                    out[i, RSI] = <float>(100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+                elif avg_gain > 0:
+                    out[i, RSI] = 100.0
+
+            # Stochastic Oscillator
+            if isnan(low[i]):
+                low_nan += 1
+            else:
+                while min_tail > min_head and low[min_dq[min_tail - 1]] >= low[i]:
+                    min_tail -= 1
+                min_dq[min_tail] = i
+                min_tail += 1
+            if isnan(high[i]):
+                high_nan += 1
+            else:
+                while max_tail > max_head and high[max_dq[max_tail - 1]] <= high[i]:
+                    max_tail -= 1
+                max_dq[max_tail] = i
+                max_tail += 1
+            if i >= k_w:
+                if isnan(low[i - k_w]):
+                    low_nan -= 1
+                if isnan(high[i - k_w]):
+                    high_nan -= 1
+            if min_tail > min_head and min_dq[min_head] <= i - k_w:
+                min_head += 1
+            if max_tail > max_head and max_dq[max_head] <= i - k_w:
+                max_head += 1
+            out[i, K] = NAN
+            k_valid = False
+            if i >= k_w - 1 and low_nan == 0 and high_nan == 0 and not x_nan:
+                low_min = low[min_dq[min_head]]
+                high_max = high[max_dq[max_head]]
+                if high_max > low_min:
+                    out[i, K] = <float>((x - low_min) / (high_max - low_min) * 100.0)
+                    k_valid = True
+            if k_valid:
+                k_sum += out[i, K]
+                k_count += 1
+            else:
+                k_sum = 0.0
+                k_count = 0
+            if k_count > d_w:
+                k_sum -= out[i - d_w, K]
+                k_count = d_w
+            out[i, D] = <float>(k_sum / d_w) if k_count == d_w else NAN
+
+            # MACD and Signal Line
+            short_ema = _ewm_step(short_ema, &short_wt, x, alpha_s)
+            long_ema = _ewm_step(long_ema, &long_wt, x, alpha_l)
+            macd_val = short_ema - long_ema
+            signal_val = _ewm_step(signal_val, &signal_wt, macd_val, alpha_sig)
+            out[i, MACD] = <float>macd_val
+            out[i, SIGNAL] = <float>signal_val
+
+            # Bollinger Bands
+            if x_nan:
+                bb_nan += 1
+            else:
+                bb_sum += x
+                bb_sq_sum += x * x
+            if i >= bb_w:
+                old = close[i - bb_w]
+                if isnan(old):
+                    bb_nan -= 1
+                else:
+                    bb_sum -= old
+                    bb_sq_sum -= old * old
+            # As in rolling_mean_std, a single-price window has no sample std and gets NaN bands
+            if bb_w > 1 and i >= bb_w - 1 and bb_nan == 0:
+                mean = bb_sum / bb_w
+                var = (bb_sq_sum - bb_sum * bb_sum / bb_w) / (bb_w - 1)
+                std = sqrt(var) if var > 0 else 0.0
+                out[i, BB_UPPER] = <float>(mean + bb_std * std)
+                out[i, BB_LOWER] = <float>(mean - bb_std * std)
+            else:
+                out[i, BB_UPPER] = NAN
+                out[i, BB_LOWER] = NAN
@@ -0,0 +1,352 @@
+"""
+Numba kernels behind TechnicalIndicators.
+
+These are JIT-compiled (and cached) on first import. build_indicators_aot.py compiles the same
+kernels ahead of time into the _indicators_aot extension, which technical_indicators.py prefers
+when it is available.
+"""
+import numpy as np
+from numba import njit, types
+
+# Kernel signatures: C-contiguous float32 price arrays in, float32 indicator arrays out. Inputs are
+# declared read-only so that pandas' copy-on-write views can be passed without copying.
+_f4_in = types.Array(types.float32, 1, "C", readonly=True)
+_f4_out = types.float32[::1]
+
+EMA_SIGNATURE = _f4_out(_f4_in, types.float64)
+ROLLING_MINMAX_SIGNATURE = _f4_out(_f4_in, types.int64, types.boolean)
+ROLLING_MEAN_STD_SIGNATURE = types.UniTuple(_f4_out, 2)(_f4_in, types.int64)
+MACD_SIGNATURE = types.UniTuple(_f4_out, 2)(_f4_in, types.float64, types.float64, types.float64)
+COMPUTE_ALL_SIGNATURE = types.void(
+    _f4_in, _f4_in, _f4_in,
+    types.int64, types.int64, types.int64, types.int64, types.int64,  # sma_w, ema_w, rsi_w, k_w, d_w
+    types.int64, types.int64, types.int64,  # macd_s, macd_l, macd_sig
+    types.int64, types.float64,  # bb_w, bb_std
+    types.float32[:, ::1],  # out
+)
+
+# Fast-math flags without 'nnan'/'ninf', so that missing (NaN) prices keep IEEE semantics
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Column layout of compute_all's output block
+SMA, EMA, RSI, K, D, MACD, SIGNAL, BB_UPPER, BB_LOWER = range(9)
+
+
+@njit(cache=True, nogil=True)
+def _ewm_step(acc, old_wt, x, alpha):
+    """
+    Advances pandas' ewm(alpha=alpha, adjust=False).mean() recurrence by one input.
+
+    As with pandas' default ignore_na=False, a missing x keeps acc but decays its weight, and acc
+    stays NaN until the first non-missing input.
+
+    :return: Tuple (acc, old_wt) after x; start from (NaN, 1.0).
+    """
+    if np.isnan(acc):
+        return np.float64(x), 1.0
+    old_wt *= 1.0 - alpha
+    if not np.isnan(x):
+        acc = (old_wt * acc + alpha * x) / (old_wt + alpha)
+        old_wt = 1.0
+    return acc, old_wt
+
+
+@njit(EMA_SIGNATURE, cache=True, fastmath=FASTMATH, nogil=True)
+def ema(x, alpha):
+    """
+    Computes the exponential moving average y[i] = alpha * x[i] + (1 - alpha) * y[i - 1].
+
+    Equivalent to pandas' ewm(alpha=alpha, adjust=False).mean(), including its handling of
+    missing values.
+
+    :param x: Input array.
+    :param alpha: Smoothing factor, 2 / (span + 1) for a span-based EMA.
+    :return: Array of EMA values.
+    """
+    y = np.empty(x.shape[0], dtype=np.float32)
+    acc, old_wt = np.nan, 1.0
+    for i in range(x.shape[0]):
+        acc, old_wt = _ewm_step(acc, old_wt, np.float64(x[i]), alpha)
+        y[i] = acc
+    return y
+
+
+@njit(MACD_SIGNATURE, cache=True, fastmath=FASTMATH, nogil=True)
+def macd(x, alpha_short, alpha_long, alpha_signal):
+    """
+    Computes the MACD line (short EMA - long EMA) and its signal line EMA.
+
+    The EMAs are subtracted and smoothed in float64 and only rounded to float32 on output,
+    exactly as in compute_all.
+
+    :param x: Input array.
+    :param alpha_short: Smoothing factor of the short EMA.
+    :param alpha_long: Smoothing factor of the long EMA.
+    :param alpha_signal: Smoothing factor of the signal line.
+    :return: Tuple of arrays (macd, signal).
+    """
+    n = x.shape[0]
+    macd_line = np.empty(n, dtype=np.float32)
+    signal = np.empty(n, dtype=np.float32)
+    short_ema, short_wt = np.nan, 1.0
+    long_ema, long_wt = np.nan, 1.0
+    signal_val, signal_wt = np.nan, 1.0
+    for i in range(n):
+        v = np.float64(x[i])
+        short_ema, short_wt = _ewm_step(short_ema, short_wt, v, alpha_short)
+        long_ema, long_wt = _ewm_step(long_ema, long_wt, v, alpha_long)
+        macd_val = short_ema - long_ema
+        signal_val, signal_wt = _ewm_step(signal_val, signal_wt, macd_val, alpha_signal)
+        macd_line[i] = macd_val
+        signal[i] = signal_val
+    return macd_line, signal
+
+
+@njit(ROLLING_MINMAX_SIGNATURE, cache=True, nogil=True)
+def rolling_minmax(x, w, find_max):
+    """
+    Computes the rolling minimum (or maximum) of x in O(N) with a monotonic deque.
+
+    :param x: Input array.
+    :param w: Window length.
+    :param find_max: Compute the rolling maximum instead of the minimum.
+    :return: Array of rolling extrema, NaN for the first w - 1 entries and for every window
+             containing a missing value, as with pandas' rolling(w).
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan, dtype=np.float32)
+    dq = np.empty(n, dtype=np.int64)
+    head = tail = 0
+    # Missing values are counted instead of pushed, as NaN comparisons would corrupt the deque
+    n_nan = 0
+    for i in range(n):
+        if np.isnan(x[i]):
+            n_nan += 1
+        else:
+            if find_max:
+                while tail > head and x[dq[tail - 1]] <= x[i]:
+                    tail -= 1
+            else:
+                while tail > head and x[dq[tail - 1]] >= x[i]:
+                    tail -= 1
+            dq[tail] = i
+            tail += 1
+        if i >= w and np.isnan(x[i - w]):
+            n_nan -= 1
+        if tail > head and dq[head] <= i - w:
+            head += 1
+        if i >= w - 1 and n_nan == 0:
+            out[i] = x[dq[head]]
+    return out
+
+
+@njit(ROLLING_MEAN_STD_SIGNATURE, cache=True, nogil=True)
+def rolling_mean_std(x, w):
+    """
+    Computes the rolling mean and sample standard deviation of x in a single pass.
+
+    :param x: Input array.
+    :param w: Window length.
+    :return: Tuple of arrays (mean, std), NaN for the first w - 1 entries and for every window
+             containing a missing value, as with pandas' rolling(w). std is all NaN for w = 1.
+    """
+    n = x.shape[0]
+    mean = np.full(n, np.nan, dtype=np.float32)
+    std = np.full(n, np.nan, dtype=np.float32)
+    # Accumulate in float64 so that s2 - s1^2 / w does not cancel catastrophically. Missing
+    # values are counted instead of summed, so they only affect the windows that contain them.
+    s1 = 0.0
+    s2 = 0.0
+    n_nan = 0
+    for i in range(n):
+        v = np.float64(x[i])
+        if np.isnan(v):
+            n_nan += 1
+        else:
+            s1 += v
+            s2 += v * v
+        if i >= w:
+            old = np.float64(x[i - w])
+            if np.isnan(old):
+                n_nan -= 1
+            else:
+                s1 -= old
+                s2 -= old * old
+        if i >= w - 1 and n_nan == 0:
+            mean[i] = s1 / w
+            # The sample std of a single value is undefined; std stays NaN, as in pandas
+            if w > 1:
+                var = (s2 - s1 * s1 / w) / (w - 1)
+                std[i] = np.sqrt(var) if var > 0 else 0.0
+    return mean, std
+
+
+@njit(COMPUTE_ALL_SIGNATURE, cache=True, fastmath=FASTMATH, nogil=True)
+def compute_all(close, high, low, sma_w, ema_w, rsi_w, k_w, d_w,
+                macd_s, macd_l, macd_sig, bb_w, bb_std, out):
+    """
+    Computes every indicator of TechnicalIndicators in a single pass over the price arrays.
+
+    Rolling windows are maintained with running sums (SMA, %D, Bollinger Bands) and
+    monotonic deques (%K), exponential averages with their usual recurrences. Missing prices
+    are handled like pandas: a rolling window containing one is NaN, and the exponential
+    averages carry their state over it.
+
+    :param out: Preallocated (N, 9) array receiving the indicators, one column per
+                SMA, EMA, RSI, K, D, MACD, SIGNAL, BB_UPPER and BB_LOWER index.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+
+    alpha_ema = 2.0 / (ema_w + 1)
+    alpha_rsi = 1.0 / rsi_w
+    alpha_s = 2.0 / (macd_s + 1)
+    alpha_l = 2.0 / (macd_l + 1)
+    alpha_sig = 2.0 / (macd_sig + 1)
+
+    # Monotonic deques of candidate indices for the rolling Low minimum / High maximum
+    min_dq = np.empty(n, dtype=np.int64)
+    max_dq = np.empty(n, dtype=np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+
+    # Running state is kept in float64; only the outputs are float32. The *_nan counters track
+    # missing values inside each rolling window, which are left out of the running sums.
+    sma_sum = 0.0
+    sma_nan = 0
+    bb_sum = 0.0
+    bb_sq_sum = 0.0
+    bb_nan = 0
+    low_nan = 0
+    high_nan = 0
+    k_sum = 0.0
+    k_count = 0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ema_val, ema_wt = np.nan, 1.0
+    short_ema, short_wt = np.nan, 1.0
+    long_ema, long_wt = np.nan, 1.0
+    signal_val, signal_wt = np.nan, 1.0
+
+    for i in range(n):
+        x = np.float64(close[i])
+        x_nan = np.isnan(x)
+
+        # Simple Moving Average
+        if x_nan:
+            sma_nan += 1
+        else:
+            sma_sum += x
+        if i >= sma_w:
+            old = np.float64(close[i - sma_w])
+            if np.isnan(old):
+                sma_nan -= 1
+            else:
+                sma_sum -= old
+        out[i, SMA] = sma_sum / sma_w if i >= sma_w - 1 and sma_nan == 0 else np.nan
+
+        # Exponential Moving Average
+        ema_val, ema_wt = _ewm_step(ema_val, ema_wt, x, alpha_ema)
+        out[i, EMA] = ema_val
+
+        # Relative Strength Index (Wilder's smoothing); a missing price counts as no change
+        out[i, RSI] = np.nan
+        if i > 0:
+            delta = x - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = alpha_rsi * gain + (1.0 - alpha_rsi) * avg_gain
+            avg_loss = alpha_rsi * loss + (1.0 - alpha_rsi) * avg_loss
+            if avg_loss > 0:
+                out[i, RSI] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i, RSI] = 100.0
+
+        # Stochastic Oscillator
+        if np.isnan(low[i]):
+            low_nan += 1
+        else:
+            while min_tail > min_head and low[min_dq[min_tail - 1]] >= low[i]:
+                min_tail -= 1
+            min_dq[min_tail] = i
+            min_tail += 1
+        if np.isnan(high[i]):
+            high_nan += 1
+        else:
+            while max_tail > max_head and high[max_dq[max_tail - 1]] <= high[i]:
+                max_tail -= 1
+            max_dq[max_tail] = i
+            max_tail += 1
+        if i >= k_w:
+            if np.isnan(low[i - k_w]):
+                low_nan -= 1
+            if np.isnan(high[i - k_w]):
+                high_nan -= 1
+        if min_tail > min_head and min_dq[min_head] <= i - k_w:
+            min_head += 1
+        if max_tail > max_head and max_dq[max_head] <= i - k_w:
+            max_head += 1
+        out[i, K] = np.nan
+        k_valid = False
+        if i >= k_w - 1 and low_nan == 0 and high_nan == 0 and not x_nan:
+            low_min = low[min_dq[min_head]]
+            high_max = high[max_dq[max_head]]
+            if high_max > low_min:
+                out[i, K] = (x - low_min) / (high_max - low_min) * 100.0
+                k_valid = True
+        if k_valid:
+            k_sum += out[i, K]
+            k_count += 1
+        else:
+            k_sum = 0.0
+            k_count = 0
+        if k_count > d_w:
+            k_sum -= out[i - d_w, K]
+            k_count = d_w
+        out[i, D] = k_sum / d_w if k_count == d_w else np.nan
+
+        # MACD and Signal Line
+        short_ema, short_wt = _ewm_step(short_ema, short_wt, x, alpha_s)
+        long_ema, long_wt = _ewm_step(long_ema, long_wt, x, alpha_l)
+        macd_val = short_ema - long_ema
+        signal_val, signal_wt = _ewm_step(signal_val, signal_wt, macd_val, alpha_sig)
+        out[i, MACD] = macd_val
+        out[i, SIGNAL] = signal_val
+
+        # Bollinger Bands
+        if x_nan:
+            bb_nan += 1
+        else:
+            bb_sum += x
+            bb_sq_sum += x * x
+        if i >= bb_w:
+            old = np.float64(close[i - bb_w])
+            if np.isnan(old):
+                bb_nan -= 1
+            else:
+                bb_sum -= old
+                bb_sq_sum -= old * old
+        # As in rolling_mean_std, a single-price window has no sample std and gets NaN bands
+        if bb_w > 1 and i >= bb_w - 1 and bb_nan == 0:
+            mean = bb_sum / bb_w
+            var = (bb_sq_sum - bb_sum * bb_sum / bb_w) / (bb_w - 1)
+            std = np.sqrt(var) if var > 0 else 0.0
+            out[i, BB_UPPER] = mean + bb_std * std
+            out[i, BB_LOWER] = mean - bb_std * std
+        else:
+            out[i, BB_UPPER] = np.nan
+            out[i, BB_LOWER] = np.nan
+
+
+# Sanity check against pandas on prices with gaps: `python src/_indicators_numba.py`
+if __name__ == "__main__":
+    import pandas as pd
+
+    prices = pd.Series(np.random.default_rng(0).normal(100, 5, 500).cumsum(), dtype=np.float32)
+    prices[[0, 1, 120, 300, 301, 302]] = np.nan
+    x = prices.to_numpy()
+
+    expected = prices.astype(np.float64).ewm(alpha=2 / 21, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ema(x, 2 / 21), expected, rtol=1e-6)
+    print("✅ ema matches pandas' ewm on data with missing values")
@@ -0,0 +1,48 @@
+"""
+Compiles the indicator kernels of _indicators_numba ahead of time into the _indicators_aot
+extension module, so that technical_indicators.py does not pay any JIT compilation on startup.
+
+Usage (writes the extension next to this file):
+
+    python src/build_indicators_aot.py
+"""
+import os
+from numba.pycc import CC
+
+from _indicators_numba import (
+    COMPUTE_ALL_SIGNATURE, EMA_SIGNATURE, MACD_SIGNATURE, ROLLING_MEAN_STD_SIGNATURE,
+    ROLLING_MINMAX_SIGNATURE, compute_all, ema, macd, rolling_mean_std, rolling_minmax,
+)
+
+cc = CC("_indicators_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("ema", EMA_SIGNATURE)
+def _ema(x, alpha):
+    return ema(x, alpha)
+
+
+@cc.export("macd", MACD_SIGNATURE)
+def _macd(x, alpha_short, alpha_long, alpha_signal):
+    return macd(x, alpha_short, alpha_long, alpha_signal)
+
+
+@cc.export("rolling_minmax", ROLLING_MINMAX_SIGNATURE)
+def _rolling_minmax(x, w, find_max):
+    return rolling_minmax(x, w, find_max)
+
+
+@cc.export("rolling_mean_std", ROLLING_MEAN_STD_SIGNATURE)
+def _rolling_mean_std(x, w):
+    return rolling_mean_std(x, w)
+
+
+@cc.export("compute_all", COMPUTE_ALL_SIGNATURE)
+def _compute_all(close, high, low, sma_w, ema_w, rsi_w, k_w, d_w, macd_s, macd_l, macd_sig, bb_w, bb_std, out):
+    compute_all(close, high, low, sma_w, ema_w, rsi_w, k_w, d_w, macd_s, macd_l, macd_sig, bb_w, bb_std, out)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ Compiled {cc.name} into {cc.output_dir}")
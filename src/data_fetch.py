@@ -40,6 +40,37 @@ class StockDataFetcher:
         except Exception as e:
             print(f"❌ Error fetching data: {e}")
 
+    @classmethod
+    def fetch_many(cls, symbols: list, start_date: str, end_date: str) -> dict:
+        """
+        Fetches historical stock data for several symbols with one batched, multi-threaded download.
+
+        :param symbols: List of stock symbols (e.g., ['IOC.NS', 'TCS.NS']).
+        :param start_date: The start date for fetching historical data (YYYY-MM-DD format).
+        :param end_date: The end date for fetching historical data (YYYY-MM-DD format).
+        :return: Dictionary mapping each symbol with data to its Open, High, Low, Close, Volume DataFrame.
+        """
+        try:
+            data = yf.download(symbols, start=start_date, end=end_date, group_by='ticker',
+                               threads=True, auto_adjust=True, progress=False)
+        except Exception as e:
+            print(f"❌ Error fetching data: {e}")
+            return {}
+
+        results = {}
+        for symbol in symbols:
+            if symbol not in data.columns.get_level_values(0):
+                print(f"❌ Error fetching data: No data found for {symbol} in the given date range.")
+                continue
+            # Keep only relevant columns, dropping dates on which only other symbols traded
+            symbol_data = data[symbol][['Open', 'High', 'Low', 'Close', 'Volume']].dropna(how='all')
+            if symbol_data.empty:
+                print(f"❌ Error fetching data: No data found for {symbol} in the given date range.")
+                continue
+            results[symbol] = symbol_data
+            print(f"✅ Successfully fetched data for {symbol}.")
+        return results
+
     def save_to_csv(self, folder_path: str = "data"):
         """
         Saves the fetched stock data as a CSV file.
@@ -68,11 +99,13 @@ class StockDataFetcher:
 
 # Example Usage
 if __name__ == "__main__":
-    stock_symbol = input("Enter NSE stock symbol (e.g., IOC.NS): ").strip().upper()
+    stock_symbols = input("Enter NSE stock symbols, comma-separated (e.g., IOC.NS,TCS.NS): ").strip().upper()
+    symbols = [symbol.strip() for symbol in stock_symbols.split(",") if symbol.strip()]
     start_date = "2015-01-01"
     end_date = datetime.today().strftime('%Y-%m-%d')
 
-    fetcher = StockDataFetcher(stock_symbol, start_date, end_date)
-    fetcher.fetch_data()
-    fetcher.show_sample_data()
-    fetcher.save_to_csv()
+    for symbol, data in StockDataFetcher.fetch_many(symbols, start_date, end_date).items():
+        fetcher = StockDataFetcher(symbol, start_date, end_date)
+        fetcher.data = data
+        fetcher.show_sample_data()
+        fetcher.save_to_csv()
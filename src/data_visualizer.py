@@ -1,6 +1,12 @@
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import matplotlib.ticker as mticker
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 
 class TechnicalIndicatorVisualizer:
@@ -8,107 +14,144 @@ class TechnicalIndicatorVisualizer:
     A class to visualize various technical indicators for stock market data.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: Optional[str] = None, dataframe: Optional[pd.DataFrame] = None,
+                 name: Optional[str] = None):
         """
         Initializes the TechnicalIndicatorVisualizer class.
 
-        :param file_path: Path to the CSV file containing processed stock market data with indicators.
+        :param file_path: Path to the Parquet or CSV file containing processed stock market data with indicators.
+        :param dataframe: Processed data already in memory (e.g., TechnicalIndicators.data); skips reading file_path.
+        :param name: Name of the output folder, defaults to the file name of file_path.
         """
-        if not os.path.exists(file_path):
+        if dataframe is not None:
+            self.data = dataframe
+        elif file_path is None:
+            raise ValueError("❌ Error: Either file_path or dataframe must be provided.")
+        elif not os.path.exists(file_path):
             raise FileNotFoundError(f"❌ Error: The file {file_path} does not exist.")
-
+        elif file_path.endswith(".parquet"):
+            self.data = pd.read_parquet(file_path)
+        else:
+            self.data = pd.read_csv(file_path, index_col="Date", parse_dates=True, date_format="ISO8601")
         self.file_path = file_path
-        self.data = pd.read_csv(file_path, index_col="Date", parse_dates=True)
+
+        # Convert the dates and locate the date ticks once, and share them across all plots
+        self._xnums = mdates.date2num(self.data.index.to_pydatetime())
+        self._date_ticks = []
+        if len(self.data):
+            locator = mdates.AutoDateLocator(tz=self.data.index.tz)
+            self._date_ticks = locator.tick_values(self.data.index[0].to_pydatetime(),
+                                                   self.data.index[-1].to_pydatetime())
 
         # Extract file name (without extension) to create a dedicated folder
-        file_name = os.path.splitext(os.path.basename(file_path))[0]
-        self.output_folder = os.path.join("stock_visualizations", file_name)
+        if name is None:
+            name = os.path.splitext(os.path.basename(file_path))[0] if file_path else "stock"
+        self.output_folder = os.path.join("stock_visualizations", name)
         os.makedirs(self.output_folder, exist_ok=True)
 
+    def _format_date_axis(self, ax):
+        """Applies the shared date ticks and a concise date format to the x-axis of a plot."""
+        # Locators and formatters keep a reference to their axis, so each plot gets its own instances
+        locator = mticker.FixedLocator(self._date_ticks)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator, tz=self.data.index.tz))
+
     def plot_moving_averages(self):
         """Plots stock closing price with SMA and EMA."""
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.data.index, self.data["Close"], label="Close Price", color="black")
-        plt.plot(self.data.index, self.data["SMA_20"], label="SMA (20)", linestyle="dashed", color="blue")
-        plt.plot(self.data.index, self.data["EMA_20"], label="EMA (20)", linestyle="dashed", color="red")
-        plt.title("Stock Price with SMA & EMA")
-        plt.xlabel("Date")
-        plt.ylabel("Price")
-        plt.legend()
-        plt.grid()
-        plt.savefig(f"{self.output_folder}/moving_averages.png")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.plot(self._xnums, self.data["Close"], label="Close Price", color="black")
+        ax.plot(self._xnums, self.data["SMA_20"], label="SMA (20)", linestyle="dashed", color="blue")
+        ax.plot(self._xnums, self.data["EMA_20"], label="EMA (20)", linestyle="dashed", color="red")
+        ax.set_title("Stock Price with SMA & EMA")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price")
+        ax.legend()
+        ax.grid()
+        self._format_date_axis(ax)
+        return fig
 
     def plot_rsi(self):
         """Plots the Relative Strength Index (RSI)."""
-        plt.figure(figsize=(12, 4))
-        plt.plot(self.data.index, self.data["RSI"], label="RSI", color="purple")
-        plt.axhline(y=70, color="red", linestyle="dashed")  # Overbought level
-        plt.axhline(y=30, color="green", linestyle="dashed")  # Oversold level
-        plt.title("Relative Strength Index (RSI)")
-        plt.xlabel("Date")
-        plt.ylabel("RSI Value")
-        plt.legend()
-        plt.grid()
-        plt.savefig(f"{self.output_folder}/rsi.png")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 4))
+        ax.plot(self._xnums, self.data["RSI"], label="RSI", color="purple")
+        ax.axhline(y=70, color="red", linestyle="dashed")  # Overbought level
+        ax.axhline(y=30, color="green", linestyle="dashed")  # Oversold level
+        ax.set_title("Relative Strength Index (RSI)")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("RSI Value")
+        ax.legend()
+        ax.grid()
+        self._format_date_axis(ax)
+        return fig
 
     def plot_stochastic_oscillator(self):
         """Plots the Stochastic Oscillator (%K and %D)."""
-        plt.figure(figsize=(12, 4))
-        plt.plot(self.data.index, self.data["%K"], label="Stochastic %K", color="blue")
-        plt.plot(self.data.index, self.data["%D"], label="Stochastic %D", color="red")
-        plt.axhline(y=80, color="red", linestyle="dashed")  # Overbought level
-        plt.axhline(y=20, color="green", linestyle="dashed")  # Oversold level
-        plt.title("Stochastic Oscillator")
-        plt.xlabel("Date")
-        plt.ylabel("Value")
-        plt.legend()
-        plt.grid()
-        plt.savefig(f"{self.output_folder}/stochastic_oscillator.png")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 4))
+        ax.plot(self._xnums, self.data["%K"], label="Stochastic %K", color="blue")
+        ax.plot(self._xnums, self.data["%D"], label="Stochastic %D", color="red")
+        ax.axhline(y=80, color="red", linestyle="dashed")  # Overbought level
+        ax.axhline(y=20, color="green", linestyle="dashed")  # Oversold level
+        ax.set_title("Stochastic Oscillator")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Value")
+        ax.legend()
+        ax.grid()
+        self._format_date_axis(ax)
+        return fig
 
     def plot_macd(self):
         """Plots the MACD and Signal Line."""
-        plt.figure(figsize=(12, 4))
-        plt.plot(self.data.index, self.data["MACD"], label="MACD", color="blue")
-        plt.plot(self.data.index, self.data["MACD_Signal"], label="Signal Line", color="red")
-        plt.axhline(y=0, color="black", linestyle="dashed")  # Zero line
-        plt.title("MACD (Moving Average Convergence Divergence)")
-        plt.xlabel("Date")
-        plt.ylabel("MACD Value")
-        plt.legend()
-        plt.grid()
-        plt.savefig(f"{self.output_folder}/macd.png")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 4))
+        ax.plot(self._xnums, self.data["MACD"], label="MACD", color="blue")
+        ax.plot(self._xnums, self.data["MACD_Signal"], label="Signal Line", color="red")
+        ax.axhline(y=0, color="black", linestyle="dashed")  # Zero line
+        ax.set_title("MACD (Moving Average Convergence Divergence)")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("MACD Value")
+        ax.legend()
+        ax.grid()
+        self._format_date_axis(ax)
+        return fig
 
     def plot_bollinger_bands(self):
         """Plots the stock price along with Bollinger Bands."""
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.data.index, self.data["Close"], label="Close Price", color="black")
-        plt.plot(self.data.index, self.data["Bollinger_Upper"], label="Upper Band", linestyle="dashed", color="red")
-        plt.plot(self.data.index, self.data["Bollinger_Lower"], label="Lower Band", linestyle="dashed", color="blue")
-        plt.fill_between(self.data.index, self.data["Bollinger_Lower"], self.data["Bollinger_Upper"], color="gray", alpha=0.2)
-        plt.title("Bollinger Bands")
-        plt.xlabel("Date")
-        plt.ylabel("Price")
-        plt.legend()
-        plt.grid()
-        plt.savefig(f"{self.output_folder}/bollinger_bands.png")
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.plot(self._xnums, self.data["Close"], label="Close Price", color="black")
+        ax.plot(self._xnums, self.data["Bollinger_Upper"], label="Upper Band", linestyle="dashed", color="red")
+        ax.plot(self._xnums, self.data["Bollinger_Lower"], label="Lower Band", linestyle="dashed", color="blue")
+        ax.fill_between(self._xnums, self.data["Bollinger_Lower"], self.data["Bollinger_Upper"], color="gray", alpha=0.2)
+        ax.set_title("Bollinger Bands")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price")
+        ax.legend()
+        ax.grid()
+        self._format_date_axis(ax)
+        return fig
 
     def visualize_all(self):
         """Runs all visualization methods and saves all plots in the corresponding folder."""
-        self.plot_moving_averages()
-        self.plot_rsi()
-        self.plot_stochastic_oscillator()
-        self.plot_macd()
-        self.plot_bollinger_bands()
+        plots = {
+            "moving_averages.png": self.plot_moving_averages,
+            "rsi.png": self.plot_rsi,
+            "stochastic_oscillator.png": self.plot_stochastic_oscillator,
+            "macd.png": self.plot_macd,
+            "bollinger_bands.png": self.plot_bollinger_bands,
+        }
+        # Figures are built on this thread since pyplot is not thread-safe; only the PNG encoding runs in the pool
+        figures = {file_name: plot() for file_name, plot in plots.items()}
+        with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+            futures = [executor.submit(fig.savefig, os.path.join(self.output_folder, file_name),
+                                       dpi=100, bbox_inches="tight")
+                       for file_name, fig in figures.items()]
+            for future in futures:
+                future.result()
+        for fig in figures.values():
+            plt.close(fig)
 
 
 # Example Usage
 if __name__ == "__main__":
-    input_file = input("Enter the processed CSV file path (e.g., processed_stock_data/IOC.NS_2020-01-01_to_2025-02-24.csv): ").strip()
+    input_file = input("Enter the processed data file path (e.g., data/processed_stock_data/IOC.NS_2020-01-01_to_2025-02-24.parquet): ").strip()
     
     visualizer = TechnicalIndicatorVisualizer(input_file)
     visualizer.visualize_all()
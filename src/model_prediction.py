@@ -1,45 +1,61 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from prophet import Prophet
+from prophet.serialize import model_to_json, model_from_json
+from statistics import NormalDist
+import hashlib
 import os
 
 class StockPredictor:
-    def __init__(self, csv_file):
+    def __init__(self, csv_file, cache_dir=".prophet_cache", uncertainty_samples=0):
         """
-        Initializes the StockPredictor with a CSV file.
+        Initializes the StockPredictor with a CSV or Parquet file.
 
-        :param csv_file: Path to the stock data CSV file.
+        :param csv_file: Path to the stock data CSV file, or a Parquet file written by
+                         TechnicalIndicators.save_to_parquet.
+        :param cache_dir: Folder where trained models are cached, keyed on the CSV file's contents.
+        :param uncertainty_samples: Number of Monte-Carlo samples predict() draws for the uncertainty
+                                    interval; 0 skips sampling and only forecasts yhat.
         """
         self.csv_file = csv_file
+        self.uncertainty_samples = uncertainty_samples
         self.df = self._load_data()
-        self.model = Prophet()
+        self.model = Prophet(uncertainty_samples=uncertainty_samples)
+
+        with open(csv_file, 'rb') as f:
+            cache_key = hashlib.sha1(f.read()).hexdigest()
+        self.cache_path = os.path.join(cache_dir, f"{cache_key}.json")
 
     def _load_data(self):
         """
         Loads and preprocesses the stock data for Prophet.
 
-        - Reads the CSV file.
+        - Reads only the 'Date' and 'Close' columns of the CSV or Parquet file.
         - Ensures necessary columns exist.
         - Converts the 'Date' column to datetime and removes timezone.
         - Drops missing values.
 
         :return: Processed DataFrame.
         """
-        df = pd.read_csv(self.csv_file)
+        # Only parse the columns Prophet needs
+        required_cols = {'Date', 'Close'}
+        if self.csv_file.endswith('.parquet'):
+            # Processed Parquet files keep 'Date' as the index
+            df = pd.read_parquet(self.csv_file, columns=['Close']).reset_index()
+        else:
+            df = pd.read_csv(self.csv_file, usecols=lambda col: col in required_cols,
+                             dtype={'Close': 'float32'}, engine='c')
 
         # Ensure required columns exist
-        required_cols = {'Date', 'Close'}
         missing_cols = required_cols - set(df.columns)
         if missing_cols:
             raise ValueError(f"Missing columns in CSV file: {missing_cols}")
 
-        # Select necessary columns
-        df = df[['Date', 'Close']]  # Prophet requires 'ds' (date) and 'y' (target)
-
         # Convert 'Date' column to datetime and remove timezone
-        df.rename(columns={'Date': 'ds', 'Close': 'y'}, inplace=True)
-        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
+        df.rename(columns={'Date': 'ds', 'Close': 'y'}, inplace=True)  # Prophet requires 'ds' (date) and 'y' (target)
+        df['ds'] = pd.to_datetime(df['ds'], format='ISO8601', errors='coerce', cache=True)
         df['ds'] = df['ds'].dt.tz_localize(None)  # Remove timezone if present
 
         # Drop any rows with missing values
@@ -50,8 +66,35 @@ class StockPredictor:
     def train_model(self):
         """
         Trains the Prophet model on the stock data.
+
+        A model previously trained on the same CSV contents is loaded from the cache instead.
         """
+        if os.path.exists(self.cache_path):
+            self.load()
+            return
         self.model.fit(self.df)
+        self.save()
+
+    def save(self, model_path=None):
+        """
+        Saves the trained Prophet model as JSON.
+
+        :param model_path: Path of the JSON file, defaults to the cache path for this CSV file.
+        """
+        model_path = model_path or self.cache_path
+        os.makedirs(os.path.dirname(model_path) or ".", exist_ok=True)
+        with open(model_path, 'w') as f:
+            f.write(model_to_json(self.model))
+
+    def load(self, model_path=None):
+        """
+        Loads a trained Prophet model from JSON.
+
+        :param model_path: Path of the JSON file, defaults to the cache path for this CSV file.
+        """
+        with open(model_path or self.cache_path, 'r') as f:
+            self.model = model_from_json(f.read())
+        self.model.uncertainty_samples = self.uncertainty_samples
 
     def predict(self, future_days=365):
         """
@@ -64,6 +107,46 @@ class StockPredictor:
         forecast = self.model.predict(future)
         return forecast
 
+    def predict_fast(self, future_days=365):
+        """
+        Predicts stock prices like predict(), but computes the uncertainty interval in closed form
+        instead of simulating uncertainty_samples trend trajectories.
+
+        The interval combines the fitted observation noise (sigma_obs) with the variance of the
+        future trend changepoints Prophet would otherwise sample: they occur at the historical
+        rate with Laplace(0, mean |delta|) magnitudes, giving a trend variance of
+        2 * lambda^2 * S * h^3 / 3 after a horizon h. This only holds for MAP fits, so models
+        fitted with mcmc_samples > 0 fall back to predict().
+
+        :param future_days: Number of days to predict into the future.
+        :return: DataFrame with predictions.
+        """
+        if self.model.mcmc_samples > 0:
+            return self.predict(future_days)
+
+        future = self.model.make_future_dataframe(periods=future_days)
+        df = self.model.setup_dataframe(future.copy())
+        df['trend'] = self.model.predict_trend(df)
+        seasonal_components = self.model.predict_seasonal_components(df)
+        forecast = pd.concat((df[['ds', 'trend']], seasonal_components), axis=1)
+        forecast['yhat'] = forecast['trend'] * (1 + forecast['multiplicative_terms']) + forecast['additive_terms']
+
+        params = self.model.params
+        sigma_obs = float(np.ravel(params['sigma_obs'])[0])
+        trend_var = np.zeros(len(df))
+        n_changepoints = len(self.model.changepoints_t)
+        if self.model.growth == 'linear' and n_changepoints > 0:
+            horizon = np.clip(df['t'].to_numpy() - 1, 0, None)  # History is scaled to t in [0, 1]
+            lam = np.mean(np.abs(params['delta'])) + 1e-8
+            trend_var = 2 * lam ** 2 * n_changepoints * horizon ** 3 / 3
+        trend_scale = 1 + forecast['multiplicative_terms'].to_numpy()
+        sigma = np.sqrt(sigma_obs ** 2 + trend_var * trend_scale ** 2) * self.model.y_scale
+
+        z = NormalDist().inv_cdf(0.5 + self.model.interval_width / 2)
+        forecast['yhat_lower'] = forecast['yhat'] - z * sigma
+        forecast['yhat_upper'] = forecast['yhat'] + z * sigma
+        return forecast
+
     def plot_forecast(self, forecast, save_path="stock_forecast/forecast_plot.png"):
         """
         Plots the forecasted stock prices with improved visualization.
@@ -83,8 +166,9 @@ class StockPredictor:
         # Plot predicted prices
         plt.plot(forecast['ds'], forecast['yhat'], label="Predicted Prices", color='#d62728', linewidth=2)
 
-        # Confidence interval shading
-        plt.fill_between(forecast['ds'], forecast['yhat_lower'], forecast['yhat_upper'], color='pink', alpha=0.3)
+        # Confidence interval shading (absent when predicted without uncertainty samples)
+        if {'yhat_lower', 'yhat_upper'} <= set(forecast.columns):
+            plt.fill_between(forecast['ds'], forecast['yhat_lower'], forecast['yhat_upper'], color='pink', alpha=0.3)
 
         # Title and labels
         plt.xlabel("Date", fontsize=12, fontweight='bold')
@@ -118,11 +202,11 @@ class StockPredictor:
         print(f"Forecast saved as {output_file}")
 
 # ✅ Example Usage:
-predictor = StockPredictor(r"data\processed_stock_data\wipro_ns.csv")
+predictor = StockPredictor(r"data\processed_stock_data\wipro_ns.parquet")
 predictor.train_model()
 forecast = predictor.predict(365)  # Predict for 1 year
 predictor.plot_forecast(forecast, "stock_forecast/wipro_forecast.png")
 predictor.save_forecast(forecast, "stock_forecast/wipro_forecast.csv")
 
 # Display first few rows of predictions
-print(forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].head())
+print(forecast[[col for col in ['ds', 'yhat', 'yhat_lower', 'yhat_upper'] if col in forecast.columns]].head())
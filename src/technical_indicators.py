@@ -1,6 +1,18 @@
+import numpy as np
 import pandas as pd
 import os
 
+# Prefer a precompiled build of the indicator kernels and fall back to Numba's JIT otherwise
+try:
+    # Cython extension, built with `python setup.py build_ext --inplace`
+    from _indicators import compute_all, ema, macd, rolling_mean_std, rolling_minmax
+except ImportError:
+    try:
+        # Numba AOT extension, built with `python src/build_indicators_aot.py`
+        from _indicators_aot import compute_all, ema, macd, rolling_mean_std, rolling_minmax
+    except ImportError:
+        from _indicators_numba import compute_all, ema, macd, rolling_mean_std, rolling_minmax
+
 
 class TechnicalIndicators:
     """
@@ -17,7 +29,19 @@ class TechnicalIndicators:
             raise FileNotFoundError(f"❌ Error: The file {file_path} does not exist.")
         
         self.file_path = file_path
-        self.data = pd.read_csv(file_path, index_col="Date", parse_dates=True)
+        self.data = pd.read_csv(file_path, index_col="Date", parse_dates=True, date_format="ISO8601")
+
+        # Prices only need float32 precision; Volume stays integral
+        price_cols = ["Open", "High", "Low", "Close"]
+        self.data = self.data.astype({col: "float32" for col in price_cols if col in self.data.columns})
+
+    def _prep(self, column: str) -> np.ndarray:
+        """
+        Returns a column as the C-contiguous float32 array the compiled kernels expect.
+
+        :param column: Name of the column.
+        """
+        return np.ascontiguousarray(self.data[column].to_numpy(dtype=np.float32))
 
     def calculate_sma(self, window: int = 20):
         """
@@ -25,7 +49,7 @@ class TechnicalIndicators:
 
         :param window: Lookback period for SMA.
         """
-        self.data[f"SMA_{window}"] = self.data["Close"].rolling(window=window).mean()
+        self.data[f"SMA_{window}"] = self.data["Close"].rolling(window=window).mean().astype(np.float32)
 
     def calculate_ema(self, window: int = 20):
         """
@@ -33,19 +57,20 @@ class TechnicalIndicators:
 
         :param window: Lookback period for EMA.
         """
-        self.data[f"EMA_{window}"] = self.data["Close"].ewm(span=window, adjust=False).mean()
+        self.data[f"EMA_{window}"] = ema(self._prep("Close"), 2 / (window + 1))
 
     def calculate_rsi(self, window: int = 14):
         """
-        Computes the Relative Strength Index (RSI).
+        Computes the Relative Strength Index (RSI) using Wilder's smoothing.
 
         :param window: Lookback period for RSI.
         """
-        delta = self.data["Close"].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        self.data["RSI"] = 100 - (100 / (1 + rs))
+        delta = self.data["Close"].diff().to_numpy()
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        avg_gain = pd.Series(gain, index=self.data.index).ewm(alpha=1 / window, adjust=False).mean()
+        avg_loss = pd.Series(loss, index=self.data.index).ewm(alpha=1 / window, adjust=False).mean()
+        self.data["RSI"] = (100 - (100 / (1 + avg_gain / avg_loss))).astype(np.float32)
 
     def calculate_stochastic_oscillator(self, k_window: int = 14, d_window: int = 3):
         """
@@ -54,10 +79,11 @@ class TechnicalIndicators:
         :param k_window: Lookback period for %K.
         :param d_window: Lookback period for %D (signal line).
         """
-        low_min = self.data["Low"].rolling(window=k_window).min()
-        high_max = self.data["High"].rolling(window=k_window).max()
-        self.data["%K"] = ((self.data["Close"] - low_min) / (high_max - low_min)) * 100
-        self.data["%D"] = self.data["%K"].rolling(window=d_window).mean()
+        low_min = rolling_minmax(self._prep("Low"), k_window, False)
+        high_max = rolling_minmax(self._prep("High"), k_window, True)
+        close = self._prep("Close")
+        self.data["%K"] = ((close - low_min) / (high_max - low_min)) * 100
+        self.data["%D"] = self.data["%K"].rolling(window=d_window).mean().astype(np.float32)
 
     def calculate_macd(self, short_window: int = 12, long_window: int = 26, signal_window: int = 9):
         """
@@ -67,23 +93,49 @@ class TechnicalIndicators:
         :param long_window: Long EMA period.
         :param signal_window: Signal line EMA period.
         """
-        short_ema = self.data["Close"].ewm(span=short_window, adjust=False).mean()
-        long_ema = self.data["Close"].ewm(span=long_window, adjust=False).mean()
-        self.data["MACD"] = short_ema - long_ema
-        self.data["MACD_Signal"] = self.data["MACD"].ewm(span=signal_window, adjust=False).mean()
+        macd_line, signal = macd(
+            self._prep("Close"), 2 / (short_window + 1), 2 / (long_window + 1), 2 / (signal_window + 1)
+        )
+        self.data["MACD"] = macd_line
+        self.data["MACD_Signal"] = signal
 
     def calculate_bollinger_bands(self, window: int = 20, num_std: int = 2):
         """
         Computes Bollinger Bands.
 
+        The middle band is also stored as SMA_{window}, so calculate_sma need not be
+        called separately for the same window.
+
         :param window: Lookback period for the moving average.
         :param num_std: Number of standard deviations for the bands.
         """
-        sma = self.data["Close"].rolling(window=window).mean()
-        std_dev = self.data["Close"].rolling(window=window).std()
+        sma, std_dev = rolling_mean_std(self._prep("Close"), window)
+        self.data[f"SMA_{window}"] = sma
         self.data["Bollinger_Upper"] = sma + (num_std * std_dev)
         self.data["Bollinger_Lower"] = sma - (num_std * std_dev)
 
+    def calculate_all(self, sma_window: int = 20, ema_window: int = 20, rsi_window: int = 14,
+                      k_window: int = 14, d_window: int = 3, short_window: int = 12,
+                      long_window: int = 26, signal_window: int = 9, bb_window: int = 20,
+                      num_std: int = 2):
+        """
+        Computes all indicators at once with a single compiled pass over the price data.
+
+        Produces the same columns as calling every calculate_* method with the matching parameters.
+        """
+        columns = [f"SMA_{sma_window}", f"EMA_{ema_window}", "RSI", "%K", "%D",
+                   "MACD", "MACD_Signal", "Bollinger_Upper", "Bollinger_Lower"]
+        out = np.empty((len(self.data), len(columns)), dtype=np.float32)
+        compute_all(
+            self._prep("Close"),
+            self._prep("High"),
+            self._prep("Low"),
+            sma_window, ema_window, rsi_window, k_window, d_window,
+            short_window, long_window, signal_window, bb_window, num_std, out,
+        )
+        indicators = pd.DataFrame(out, index=self.data.index, columns=columns)
+        self.data = pd.concat([self.data.drop(columns=columns, errors="ignore"), indicators], axis=1)
+
     def save_to_csv(self, output_folder: str = "./data/processed_stock_data"):
         """
         Saves the computed indicators to a new CSV file.
@@ -95,6 +147,18 @@ class TechnicalIndicators:
         self.data.to_csv(output_file)
         print(f"📂 Processed data saved to: {output_file}")
 
+    def save_to_parquet(self, output_folder: str = "./data/processed_stock_data"):
+        """
+        Saves the computed indicators to a Parquet file, which is smaller and faster to re-read than CSV.
+
+        :param output_folder: Folder where the Parquet file will be saved.
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
+        output_file = os.path.join(output_folder, f"{file_name}.parquet")
+        self.data.to_parquet(output_file)
+        print(f"📂 Processed data saved to: {output_file}")
+
     def show_sample_data(self, rows: int = 5):
         """
         Displays a sample of the processed data.
@@ -111,15 +175,10 @@ if __name__ == "__main__":
     indicators = TechnicalIndicators(input_file)
 
     # Compute Indicators
-    indicators.calculate_sma()
-    indicators.calculate_ema()
-    indicators.calculate_rsi()
-    indicators.calculate_stochastic_oscillator()
-    indicators.calculate_macd()
-    indicators.calculate_bollinger_bands()
+    indicators.calculate_all()
 
     # Show Sample Data
     indicators.show_sample_data()
 
     # Save Processed Data
-    indicators.save_to_csv()
+    indicators.save_to_parquet()